@@ -1,12 +1,12 @@
 """Manipulate 2D strings in Python."""
 
-from functools import reduce, cached_property, lru_cache
+from functools import cached_property, lru_cache
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from textwrap import dedent
 import uuid
-from typing import List, Tuple, Union, Any, Optional
+from typing import List, Tuple, Union, Any, Optional, Callable, Iterator
 from pandas import DataFrame, Series
 from IPython.display import HTML
 import numpy as np
@@ -416,10 +416,44 @@ class Str2D:
     _align_horizontal = {"left": "right", "center": "center", "right": "left"}
     _align_vertical = {"top": "bottom", "middle": "middle", "bottom": "top"}
 
+    # how many halves of the extra space go before the data for each alignment
+    _align_halves_before = {
+        "left": 0,
+        "top": 0,
+        "center": 1,
+        "middle": 1,
+        "right": 2,
+        "bottom": 2,
+    }
+
+    # decimal representations of the mpmath constants used by `pi`, `e`, and `phi`
+    _digits_cache = {}
+
     ####################################################################
     # Construction methods #############################################
     ####################################################################
 
+    @classmethod
+    def _split_extra(cls, extra: Any, align: str) -> Tuple[Any, Any]:
+        """Split `extra` cells of padding into the amounts before and after the data
+        for the alignment `align`.  `extra` may be an int or an integer array.
+
+        Parameters
+        ----------
+        extra : Union[int, np.ndarray]
+            The number of cells to add.
+
+        align : str
+            One of the validated horizontal or vertical alignments.
+
+        Returns
+        -------
+        Tuple[Union[int, np.ndarray], Union[int, np.ndarray]]
+            The padding before and after the data.
+        """
+        before = extra * cls._align_halves_before[align] // 2
+        return before, extra - before
+
     @classmethod
     def validate_fill(
         cls, fill: Optional[Union[str, Tuple[str, int]]] = None
@@ -556,39 +590,95 @@ class Str2D:
             A structured array with fields 'char' and 'alpha' created from the input
             string.
         """
-        pre_data = [list(row) for row in string.splitlines()]
+        pre_data = string.splitlines()
         # needed to use `pop or 0` as opposed to `pop(key, 0)`
         # because `None` may have been explicitly passed
         min_width = kwargs.pop("min_width", 0) or 0
         min_height = kwargs.pop("min_height", 0) or 0
-        data_width = max(map(len, pre_data), default=0)
+        lens = list(map(len, pre_data))
+        data_width = max(lens, default=0)
         data_height = len(pre_data)
         width = max(data_width, min_width)
         height = max(data_height, min_height)
 
+        # fast path for a rectangular block of text that needs no padding, the
+        # lines are viewed as a grid of single characters in one call
+        if width and height == data_height and min(lens, default=-1) == width:
+            chars = np.array(pre_data, dtype=f"<U{width}")
+            return cls.struct_array_from_char_array(
+                chars.view("<U1").reshape(height, width)
+            )
+
+        return cls.struct_array_from_rows(
+            np.array(pre_data, dtype=str),
+            min_width=min_width,
+            min_height=min_height,
+            **kwargs,
+        )
+
+    @classmethod
+    def struct_array_from_rows(cls, rows: np.ndarray, **kwargs) -> np.ndarray:
+        """Create a structured array from a 1D array of strings where each string is a
+        row.  This is the vectorized counterpart of `struct_array_from_string` and is
+        useful when the rows are already in a NumPy array, e.g. the result of one of
+        the `np.char` functions.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            A 1D array of strings, one per row.
+
+        min_width : int, optional
+            The minimum width of the output, by default 0.
+
+        min_height : int, optional
+            The minimum height of the output, by default 0.
+
+        halign : str, optional
+            The horizontal alignment, by default 'left'.
+
+        valign : str, optional
+            The vertical alignment, by default 'top'.
+
+        fill : Tuple[str, int], optional
+            The fill value for the 'char' and 'alpha' fields, by default (' ', 0).
+
+        Returns
+        -------
+        np.ndarray
+            A structured array with fields 'char' and 'alpha' created from the input
+            rows.
+        """
+        rows = np.asarray(rows, dtype=str).ravel()
+        min_width = kwargs.pop("min_width", 0) or 0
+        min_height = kwargs.pop("min_height", 0) or 0
+        lens = np.char.str_len(rows)
+        data_width = int(lens.max(initial=0))
+        data_height = len(rows)
+        width = max(data_width, min_width)
+        height = max(data_height, min_height)
+
         data = np.empty((height, width), dtype=cls._dtype)
-        fill = kwargs.pop("fill", (" ", 0))
-        data.fill(fill)
+        data.fill(kwargs.pop("fill", (" ", 0)))
+        if not (width and data_height):
+            return data
 
         halign = kwargs.pop("halign", "left")
         valign = kwargs.pop("valign", "top")
 
-        start_v = 0
-        if valign == "middle":
-            start_v = (height - data_height) // 2
-        elif valign == "bottom":
-            start_v = height - data_height
-
-        for i, row in enumerate(pre_data, start_v):
-            this_width = len(row)
-            start = 0
-            if halign == "center":
-                start = (width - this_width) // 2
-            elif halign == "right":
-                start = width - this_width
-            for j, char in enumerate(row, start):
-                data[i, j] = (char, 1)
+        start_v, _ = cls._split_extra(height - data_height, valign)
+        start, _ = cls._split_extra(width - lens, halign)
+
+        # every row is left aligned in `chars`, so the character for column `j` of
+        # row `i` is found at `j - start[i]` when that is within the row length
+        chars = rows.astype(f"<U{width}").view("<U1").reshape(data_height, width)
+        index = np.arange(width) - start[:, None]
+        mask = (index >= 0) & (index < lens[:, None])
+        chars = np.take_along_axis(chars, index.clip(0, width - 1), axis=1)
 
+        block = data[start_v : start_v + data_height]
+        block["char"][mask] = chars[mask]
+        block["alpha"][mask] = 1
         return data
 
     @classmethod
@@ -667,7 +757,11 @@ class Str2D:
             data.
 
         """
-        if isinstance(data, Str2D):
+        # strings are by far the most common input so they are checked first
+        if isinstance(data, str):
+            data = cls.struct_array_from_string(data, **kwargs)
+
+        elif isinstance(data, Str2D):
             data = data.data
 
         elif isinstance(data, np.ndarray):
@@ -679,13 +773,10 @@ class Str2D:
             else:
                 data = data.copy()
 
-        elif isinstance(data, str):
-            data = cls.struct_array_from_string(data, **kwargs)
-
         elif isinstance(data, (DataFrame, Series)):
             data = cls.struct_array_from_string(data.to_string(), **kwargs)
 
-        elif hasattr(data, "__iter__") and not isinstance(data, str):
+        elif hasattr(data, "__iter__"):
             data = cls.struct_array_from_string("\n".join(map(str, data)), **kwargs)
 
         elif data is not None:
@@ -758,31 +849,102 @@ class Str2D:
         height_data = max(height_input, min_height or 0)
         width_data = max(width_input, min_width or 0)
 
-        left = 0
-        right = width_data - width_input
-        if halign == "center":
-            left = (width_data - width_input) // 2
-            right = width_data - width_input - left
-        elif halign == "right":
-            left = width_data - width_input
-            right = 0
-
-        top = 0
-        bottom = height_data - height_input
-        if valign == "middle":
-            top = (height_data - height_input) // 2
-            bottom = height_data - height_input - top
-        elif valign == "bottom":
-            top = height_data - height_input
-            bottom = 0
-
-        data = self.struct_pad(data, ((top, bottom), (left, right)), fill=fill)
+        left, right = self._split_extra(width_data - width_input, halign)
+        top, bottom = self._split_extra(height_data - height_input, valign)
+
+        # parse already returns a new array, only pad when there is something to add
+        if top or bottom or left or right:
+            data = self.struct_pad(data, ((top, bottom), (left, right)), fill=fill)
 
         self.data = data
         self.halign = halign
         self.valign = valign
         self.fill = fill
 
+    @classmethod
+    def _from_validated(
+        cls,
+        data: np.ndarray,
+        halign: str,
+        valign: str,
+        fill: Tuple[str, int],
+    ) -> "Str2D":
+        """Create a new Str2D object from an already validated structured array and
+        already validated alignment and fill values.  This skips the validation,
+        parsing, and padding done in `__init__` and is meant for internal use where the
+        inputs are known to be good, e.g. the results of transformations.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            A structured array with the `_dtype` data type.  It is used as is and not
+            copied.
+
+        halign : str
+            The validated horizontal alignment.
+
+        valign : str
+            The validated vertical alignment.
+
+        fill : Tuple[str, int]
+            The validated fill value.
+
+        Returns
+        -------
+        Str2D
+            A new Str2D object.
+        """
+        self = object.__new__(cls)
+        self.data = data
+        self.halign = halign
+        self.valign = valign
+        self.fill = fill
+        return self
+
+    @classmethod
+    def _from_planes(
+        cls,
+        char: np.ndarray,
+        alpha: np.ndarray,
+        halign: str,
+        valign: str,
+        fill: Tuple[str, int],
+    ) -> "Str2D":
+        """Create a new Str2D object directly from a character plane and an alpha
+        plane.  Like `_from_validated`, this skips validation, parsing, and padding and
+        is meant for internal use.
+
+        Parameters
+        ----------
+        char : np.ndarray
+            A 2D '<U1' array.  It is used as is and not copied.
+
+        alpha : np.ndarray
+            A 2D int8 array with the same shape as `char`.  It is used as is and not
+            copied.
+
+        halign : str
+            The validated horizontal alignment.
+
+        valign : str
+            The validated vertical alignment.
+
+        fill : Tuple[str, int]
+            The validated fill value.
+
+        Returns
+        -------
+        Str2D
+            A new Str2D object.
+        """
+        self = object.__new__(cls)
+        self._char = char
+        self._alpha = alpha
+        self.halign = halign
+        self.valign = valign
+        self.fill = fill
+        return self
+
     ####################################################################
     # Math Operations ##################################################
     ####################################################################
@@ -820,7 +982,9 @@ class Str2D:
         add : Add the data.
         __add__ : Add the data.
         __radd__ : Add the data.
-        add : Add the data.
+        join_h : Join many objects at once.  A chain like `a + b + c` expands the
+            intermediate result again at every `+` while `join_h` expands each part
+            only once.
 
         Examples
         --------
@@ -876,19 +1040,10 @@ class Str2D:
             hello j
 
         """
-        other_expand_kwargs = {}
-        if isinstance(other, str):
-            other_expand_kwargs["mode"] = "edge"
-            if other == "":
-                other_expand_kwargs["mode"] = "constant"
-            other = Str2D(data=other)
-
-        height = max(self.height, other.height)
-        left = self.expand(y=height - self.height)
-        right = other.expand(y=height - other.height, **other_expand_kwargs)
-        if right_side:
-            left, right = right, left
-        return Str2D(data=np.hstack((left.data, right.data)), **self.kwargs)
+        if self._is_edge_char(other, axis=1):
+            return self._join_char(other, right_side, axis=1)
+        args = (other, self) if right_side else (self, other)
+        return self._join(args, "", axis=1, kwargs=self.kwargs)
 
     def __radd__(self, other: "Str2D") -> "Str2D":
         """Dunder method handling the right side of the addition operation."""
@@ -923,6 +1078,16 @@ class Str2D:
         """
         return Str2D.join_h(self, *args, **kwargs)
 
+    @staticmethod
+    def _tile_h(array: np.ndarray, n: int) -> np.ndarray:
+        """Repeat a 2D array `n` times horizontally in a single allocation."""
+        return np.tile(array, (1, n))
+
+    @staticmethod
+    def _tile_v(array: np.ndarray, n: int) -> np.ndarray:
+        """Repeat a 2D array `n` times vertically in a single allocation."""
+        return np.tile(array, (n, 1))
+
     def __mul__(self, other: int) -> "Str2D":
         """It doesn't make sense to multiply a Str2D object by another Str2D object.
         However, we can multiply a Str2D object by an integer.  This will repeat the
@@ -988,10 +1153,22 @@ class Str2D:
 
 
         """
-        return Str2D(data=np.hstack([self.data] * other), **self.kwargs)
+        if other <= 0:
+            return Str2D(**self.kwargs)
+        return Str2D._from_planes(
+            self._tile_h(self._char, other),
+            self._tile_h(self._alpha, other),
+            **self.kwargs,
+        )
 
     def __rmul__(self, other: int) -> "Str2D":
-        return Str2D(data=np.vstack([self.data] * other), **self.kwargs)
+        if other <= 0:
+            return Str2D(**self.kwargs)
+        return Str2D._from_planes(
+            self._tile_v(self._char, other),
+            self._tile_v(self._alpha, other),
+            **self.kwargs,
+        )
 
     __rmul__.__doc__ = __mul__.__doc__
 
@@ -1022,6 +1199,9 @@ class Str2D:
         __truediv__ : Divide the data.
         __rtruediv__ : Divide the data.
         div : Divide the data.
+        join_v : Join many objects at once.  A chain like `a / b / c` expands the
+            intermediate result again at every `/` while `join_v` expands each part
+            only once.
 
         Examples
         --------
@@ -1087,19 +1267,10 @@ class Str2D:
             j
 
         """
-        other_expand_kwargs = {}
-        if isinstance(other, str):
-            other_expand_kwargs["mode"] = "edge"
-            if other == "":
-                other_expand_kwargs["mode"] = "constant"
-            other = Str2D(data=other)
-
-        width = max(self.width, other.width)
-        left = self.expand(x=width - self.width)
-        right = other.expand(x=width - other.width, **other_expand_kwargs)
-        if right_side:
-            left, right = right, left
-        return Str2D(data=np.vstack((left.data, right.data)), **self.kwargs)
+        if self._is_edge_char(other, axis=0):
+            return self._join_char(other, right_side, axis=0)
+        args = (other, self) if right_side else (self, other)
+        return self._join(args, "", axis=0, kwargs=self.kwargs)
 
     def __rtruediv__(self, other: "Str2D") -> "Str2D":
         return self.__truediv__(other, right_side=True)
@@ -1267,6 +1438,21 @@ class Str2D:
         # handle the structured array fields very well.  We need to pad the 'char'
         # and 'alpha' fields separately and then recombine them into a structured
         # array.
+        char_pad, alpha_pad = cls._pad_planes(
+            array["char"], array["alpha"], *args, **kwargs
+        )
+        padded_data = np.empty(char_pad.shape, dtype=cls._dtype)
+        padded_data["char"] = char_pad
+        padded_data["alpha"] = alpha_pad
+
+        return padded_data
+
+    @staticmethod
+    def _pad_planes(
+        char: np.ndarray, alpha: np.ndarray, *args, **kwargs
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Pad a character plane and an alpha plane with `np.pad`.  Takes the same
+        arguments as `struct_pad` and returns the padded planes."""
         fill = kwargs.pop("fill", (" ", 0))
         char_fill, alpha_fill = fill
 
@@ -1280,13 +1466,9 @@ class Str2D:
         if alpha_mode == "constant":
             alpha_kwargs["constant_values"] = alpha_fill
 
-        char_pad = np.pad(array["char"], *args, **char_kwargs)
-        alpha_pad = np.pad(array["alpha"], *args, **alpha_kwargs)
-        padded_data = np.empty(char_pad.shape, dtype=cls._dtype)
-        padded_data["char"] = char_pad
-        padded_data["alpha"] = alpha_pad
-
-        return padded_data
+        char_pad = np.pad(char, *args, **char_kwargs)
+        alpha_pad = np.pad(alpha, *args, **alpha_kwargs)
+        return char_pad, alpha_pad
 
     @classmethod
     def join_h(cls, *args: "Str2D", sep: str = "") -> "Str2D":
@@ -1351,9 +1533,7 @@ class Str2D:
             j      |     |
 
         """
-        if sep:
-            args = sum(zip([sep] * len(args), args), ())[1:]
-        return reduce(lambda x, y: x + y, args)
+        return cls._join(args, sep, axis=1)
 
     @classmethod
     def join_v(cls, *args: "Str2D", sep: str = "") -> "Str2D":
@@ -1431,16 +1611,172 @@ class Str2D:
             q r s
 
         """
+        return cls._join(args, sep, axis=0)
+
+    @staticmethod
+    def _interleave(sep: Any, args: Tuple[Any]) -> Tuple[Any]:
+        """Return `args` with `sep` inserted between each pair of neighbors.  The
+        separators are written into a preallocated list, which is linear in the number
+        of arguments as opposed to repeatedly concatenating tuples."""
+        parts = [sep] * max(2 * len(args) - 1, 0)
+        parts[::2] = args
+        return tuple(parts)
+
+    @classmethod
+    def _join(
+        cls,
+        args: Tuple["Str2D"],
+        sep: str,
+        axis: int,
+        kwargs: Optional[dict] = None,
+    ) -> "Str2D":
+        """Join Str2D objects and strings along an axis.  This is the shared
+        implementation of `join_h`, `join_v`, `__add__`, and `__truediv__`.
+
+        The arguments are expanded once with `equal_height` (axis=1) or `equal_width`
+        (axis=0) and then stacked with a single `np.hstack` or `np.vstack`.
+
+        Parameters
+        ----------
+        args : Tuple[Str2D]
+            The Str2D objects or strings to join.
+
+        sep : str
+            The separator to insert between the joined data.
+
+        axis : int
+            1 to join horizontally, 0 to join vertically.
+
+        kwargs : Optional[dict], optional
+            The alignment and fill of the result, by default the ones of the first
+            Str2D argument.
+
+        Returns
+        -------
+        Str2D
+            A new Str2D object with the joined data.
+        """
+        first = args[0] if args else None
+        if not sep and isinstance(first, Str2D) and all(arg is first for arg in args):
+            # repeating one object needs no expansion, e.g. `a + a` or `join_h(a, a, a)`
+            tile = cls._tile_h if axis else cls._tile_v
+            return Str2D._from_planes(
+                tile(first._char, len(args)),
+                tile(first._alpha, len(args)),
+                **(first.kwargs if kwargs is None else kwargs),
+            )
+
         if sep:
-            args = sum(zip([sep] * len(args), args), ())[1:]
-        if args:
-            return reduce(lambda x, y: x / y, args)
-        return Str2D()
+            args = cls._interleave(sep, args)
+        if not args:
+            return Str2D()
+
+        if kwargs is None:
+            first = next((arg for arg in args if isinstance(arg, Str2D)), None)
+            kwargs = Str2D().kwargs if first is None else first.kwargs
+
+        # the parts are stacked into new planes right away, so cached strings are safe
+        parts = cls._expand_to_match(args, axis, cached=True)
+        stack = np.hstack if axis else np.vstack
+
+        char = stack([part._char for part in parts])
+        alpha = stack([part._alpha for part in parts])
+        return Str2D._from_planes(char, alpha, **kwargs)
+
+    def _is_edge_char(self, other: Any, axis: int) -> bool:
+        """Whether `other` is a single printable character that `_join_char` can
+        repeat along the edge of this object for a join along `axis`."""
+        return (
+            isinstance(other, str)
+            and len(other) == 1
+            and other.splitlines() == [other]
+            and self.shape[1 - axis] > 0
+        )
+
+    def _join_char(self, char: str, right_side: bool, axis: int) -> "Str2D":
+        """Join a single character to one side of this object, repeated along the
+        whole edge.  Gives the same result as `_join` with the one character string,
+        without parsing the string or expanding it.
+
+        Parameters
+        ----------
+        char : str
+            The character to join.
+
+        right_side : bool
+            If True, the character goes before this object, otherwise after it.
+
+        axis : int
+            1 to join horizontally, 0 to join vertically.
+
+        Returns
+        -------
+        Str2D
+            A new Str2D object with the joined data.
+        """
+        shape = (self.height, 1) if axis else (1, self.width)
+        chars = [np.full(shape, char, dtype=self._char.dtype), self._char]
+        alphas = [np.ones(shape, dtype=self._alpha.dtype), self._alpha]
+        if not right_side:
+            chars.reverse()
+            alphas.reverse()
+        return Str2D._from_planes(
+            np.concatenate(chars, axis=axis),
+            np.concatenate(alphas, axis=axis),
+            **self.kwargs,
+        )
+
+    @classmethod
+    def _with_expand_kwargs(
+        cls, arg: Any, cached: bool = False
+    ) -> Tuple["Str2D", dict]:
+        """Wrap `arg` in a Str2D object if needed and return it with the keyword
+        arguments to use when expanding it.  Strings are expanded with the `'edge'`
+        mode so that they repeat to the edge of what they are joined with.  With
+        `cached=True` strings come from the shared, read-only `_from_str` cache, which
+        is only safe when the result doesn't leave the caller."""
+        if isinstance(arg, Str2D):
+            return arg, {}
+        if isinstance(arg, str):
+            wrapped = cls._from_str(arg) if cached else Str2D(data=arg)
+            return wrapped, {"mode": "edge" if arg else "constant"}
+        return Str2D(data=arg), {}
+
+    @classmethod
+    def _expand_to_match(
+        cls, args: Tuple[Any], axis: int, cached: bool = False
+    ) -> List["Str2D"]:
+        """Expand the arguments to the same height (axis=1) or the same width (axis=0)
+        so they can be joined along `axis`.  Shared by `equal_height`, `equal_width`,
+        and `_join`."""
+        args = [cls._with_expand_kwargs(arg, cached) for arg in args]
+        sizes = [arg.shape[0 if axis else 1] for arg, _ in args]
+        max_size = max(sizes)
+        if axis:
+            return [
+                arg.expand(y=max_size - size, **kw)
+                for (arg, kw), size in zip(args, sizes)
+            ]
+        return [
+            arg.expand(x=max_size - size, **kw) for (arg, kw), size in zip(args, sizes)
+        ]
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _from_str(string: str) -> "Str2D":
+        """Return a Str2D object for a separator or other string joined with Str2D
+        objects.  The same few strings are joined over and over, so they are parsed once
+        and shared.  The planes are read-only to keep the shared object unchanged."""
+        result = Str2D(data=string)
+        result._char.flags.writeable = False
+        result._alpha.flags.writeable = False
+        return result
 
     @classmethod
     def equal_height(cls, *args: "Str2D") -> List["Str2D"]:
         """Expand each Str2D object to have the same height.  Useful for when you want
-        all Str2D objects to have the same height.
+        all Str2D objects to have the same height.  Strings are converted to Str2D
+        objects and expanded with the `'edge'` mode.
 
         Parameters
         ----------
@@ -1453,13 +1789,13 @@ class Str2D:
             A list of Str2D objects with the same height.
 
         """
-        max_height = max(arg.height for arg in args)
-        return [arg.expand(y=max_height - arg.height) for arg in args]
+        return cls._expand_to_match(args, axis=1)
 
     @classmethod
     def equal_width(cls, *args: "Str2D") -> List["Str2D"]:
         """Expand each Str2D object to have the same width.  Useful for when you want
-        all Str2D objects to have the same width.
+        all Str2D objects to have the same width.  Strings are converted to Str2D
+        objects and expanded with the `'edge'` mode.
 
         Parameters
         ----------
@@ -1472,8 +1808,7 @@ class Str2D:
             A list of Str2D objects with the same width.
 
         """
-        max_width = max(arg.width for arg in args)
-        return [arg.expand(x=max_width - arg.width) for arg in args]
+        return cls._expand_to_match(args, axis=0)
 
     @classmethod
     def equal_shape(cls, *args: "Str2D") -> List["Str2D"]:
@@ -1491,39 +1826,64 @@ class Str2D:
             A list of Str2D objects with the same shape.
 
         """
-        max_height = max(arg.height for arg in args)
-        max_width = max(arg.width for arg in args)
+        shapes = [arg.shape for arg in args]
+        max_height = max(height for height, _ in shapes)
+        max_width = max(width for _, width in shapes)
         return [
-            arg.expand(x=max_width - arg.width, y=max_height - arg.height)
-            for arg in args
+            arg.expand(x=max_width - width, y=max_height - height)
+            for arg, (height, width) in zip(args, shapes)
         ]
 
     ####################################################################
     # Attribute properties #############################################
     ####################################################################
 
+    @property
+    def data(self) -> np.ndarray:
+        """Return a copy of the data as a structured array with fields 'char' and
+        'alpha'.
+
+        Internally, the characters and alpha values are stored as two separate
+        contiguous arrays, see `char` and `alpha`.  Each access builds a new
+        structured array from them, so writing into the returned array, e.g.
+        ``a.data['char'][0, 0] = 'x'``, leaves the Str2D object unchanged.  Assign
+        to `data` or modify `char` and `alpha` in place instead.
+        """
+        data = np.empty(self._char.shape, dtype=self._dtype)
+        data["char"] = self._char
+        data["alpha"] = self._alpha
+        return data
+
+    @data.setter
+    def data(self, data: np.ndarray) -> None:
+        """Split a structured array into the character and alpha arrays."""
+        self._char = np.ascontiguousarray(data["char"])
+        self._alpha = np.ascontiguousarray(data["alpha"])
+
     @property
     def height(self) -> int:
         """Return the height of the Str2D object.  This is the number of rows in the
         structured array or the number of lines in the string."""
-        return self.data.shape[0]
+        return self._char.shape[0]
 
     @property
     def width(self) -> int:
         """Return the width of the Str2D object.  This is the number of columns in the
         structured array or the maximum number of characters in a line in the string."""
-        return self.data.shape[1]
+        return self._char.shape[1]
 
     @property
     def shape(self) -> Tuple[int, int]:
         """Return the shape of the Str2D object.  This is a tuple containing the height
         and width of the structured array."""
-        return self.data.shape
+        return self._char.shape
 
     @property
     def char(self) -> np.ndarray:
-        """Return the character data.  Alternatively, you can access the 'char' field
-        directly by using the 'data' attribute and the 'char' key.
+        """Return the character plane, a 2D array of single characters with one
+        row per line.  This is the array the Str2D object stores, not a copy, so
+        writing into it modifies the object in place.  The same values are found in
+        the 'char' field of `data`, which is a copy.
 
         Examples
         --------
@@ -1536,20 +1896,7 @@ class Str2D:
 
             a = Str2D('a b c d\\ne f g\\nh i\\nj')
 
-        We can access the 'char' field directly by using the 'data' attribute and the
-
-        .. testcode::
-
-            a.data['char']
-
-        .. testoutput::
-
-            array([['a', ' ', 'b', ' ', 'c', ' ', 'd'],
-                   ['e', ' ', 'f', ' ', 'g', ' ', ' '],
-                   ['h', ' ', 'i', ' ', ' ', ' ', ' '],
-                   ['j', ' ', ' ', ' ', ' ', ' ', ' ']], dtype='<U1')
-
-        This property is a shortcut to the above.
+        Accessing `char` returns the characters of every row.
 
         .. testcode::
 
@@ -1563,12 +1910,14 @@ class Str2D:
                    ['j', ' ', ' ', ' ', ' ', ' ', ' ']], dtype='<U1')
 
         """
-        return self.data["char"]
+        return self._char
 
     @property
     def alpha(self) -> np.ndarray:
-        """Return the alpha data.  Alternatively, you can access the 'alpha' field
-        directly by using the 'data' attribute and the 'alpha' key.
+        """Return the alpha plane, a 2D int8 array with the same shape as `char`.
+        A 1 marks a visible character and a 0 a transparent one, such as the
+        padding added to short lines.  This is the array the Str2D object stores,
+        not a copy, so writing into it modifies the object in place.
 
         Examples
         --------
@@ -1581,20 +1930,7 @@ class Str2D:
 
             a = Str2D('a b c d\\ne f g\\nh i\\nj')
 
-        We can access the 'alpha' field directly by using the 'data' attribute and the
-
-        .. testcode::
-
-            a.data['alpha']
-
-        .. testoutput::
-
-            array([[1, 1, 1, 1, 1, 1, 1],
-                   [1, 1, 1, 1, 1, 0, 0],
-                   [1, 1, 1, 0, 0, 0, 0],
-                   [1, 0, 0, 0, 0, 0, 0]], dtype=int8)
-
-        This property is a shortcut to the above.
+        Accessing `alpha` shows which cells are visible.
 
         .. testcode::
 
@@ -1608,7 +1944,22 @@ class Str2D:
                    [1, 0, 0, 0, 0, 0, 0]], dtype=int8)
 
         """
-        return self.data["alpha"]
+        return self._alpha
+
+    def _row_strings(self) -> np.ndarray:
+        """Return a 1D array with one string per row of the character array.  The
+        rows are viewed as fixed width strings rather than joined one by one."""
+        height, width = self.shape
+        if not width:
+            return np.full(height, "", dtype="<U1")
+        char = np.ascontiguousarray(self._char)
+        return char.view(f"<U{width}").ravel()
+
+    @property
+    def _mask_alpha0(self) -> np.ndarray:
+        """Boolean mask of the positions where the alpha array is 0.  It is computed on
+        access rather than cached because `alpha` may be mutated in place."""
+        return self._alpha == 0
 
     @property
     def kwargs(self) -> dict:
@@ -1639,6 +1990,9 @@ class Str2D:
         - `v` is the vertical flip of the data.
         - `r` is the 90 degree clockwise rotation of the data.
 
+        The transformations are NumPy views of the same character and alpha arrays, no
+        data is copied.
+
         Examples
         --------
 
@@ -1693,12 +2047,16 @@ class Str2D:
     @cached_property
     def t(self) -> "Str2D":
         """Return the transpose of the Str2D object."""
-        return Str2D(
-            data=self.data.T,
+        result = Str2D._from_planes(
+            char=self._char.T,
+            alpha=self._alpha.T,
             halign=self._align_transpose[self.valign],
             valign=self._align_transpose[self.halign],
             fill=self.fill,
         )
+        # t, h, and v are their own inverses, so applying one twice returns self
+        result.__dict__["t"] = self
+        return result
 
     t.__doc__ += TRANSFORMATIONS_DOCSTRING
 
@@ -1712,43 +2070,108 @@ class Str2D:
     @cached_property
     def h(self) -> "Str2D":
         """Return the horizontal flip of the data."""
-        return Str2D(
-            data=np.fliplr(self.data),
+        result = Str2D._from_planes(
+            char=self._char[:, ::-1],
+            alpha=self._alpha[:, ::-1],
             halign=self._align_horizontal[self.halign],
             valign=self.valign,
             fill=self.fill,
         )
+        result.__dict__["h"] = self
+        return result
 
     h.__doc__ += TRANSFORMATIONS_DOCSTRING
 
     @cached_property
     def v(self) -> "Str2D":
         """Return the vertical flip of the data."""
-        return Str2D(
-            data=np.flipud(self.data),
+        result = Str2D._from_planes(
+            char=self._char[::-1],
+            alpha=self._alpha[::-1],
             halign=self.halign,
             valign=self._align_vertical[self.valign],
             fill=self.fill,
         )
+        result.__dict__["v"] = self
+        return result
 
     v.__doc__ += TRANSFORMATIONS_DOCSTRING
 
     @cached_property
     def r(self) -> "Str2D":
         """Return the 90 degree rotation of the data."""
-        return self.t.h
+        # equivalent to `self.t.h` as a single view without the intermediate transpose
+        return Str2D._from_planes(
+            char=self._char.T[:, ::-1],
+            alpha=self._alpha.T[:, ::-1],
+            halign=self._align_horizontal[self._align_transpose[self.valign]],
+            valign=self._align_transpose[self.halign],
+            fill=self.fill,
+        )
 
     r.__doc__ += TRANSFORMATIONS_DOCSTRING
 
+    def _orient(self, chain: str) -> "Str2D":
+        """Apply a chain of the transformations `i`, `t`, `h`, `v`, and `r` as a single
+        view.  The chain is composed into one transpose followed by flips of the axes
+        so that no intermediate Str2D objects are created along the way.
+
+        Parameters
+        ----------
+        chain : str
+            The lowercase transformation names, applied left to right.
+
+        Returns
+        -------
+        Str2D
+            The transformed Str2D object, or this object if the chain cancels out.
+        """
+        transpose, flip_v, flip_h = False, False, False
+        halign, valign = self.halign, self.valign
+        for step in chain.replace("r", "th"):
+            if step == "t":
+                transpose = not transpose
+                flip_v, flip_h = flip_h, flip_v
+                halign, valign = (
+                    self._align_transpose[valign],
+                    self._align_transpose[halign],
+                )
+            elif step == "h":
+                flip_h = not flip_h
+                halign = self._align_horizontal[halign]
+            elif step == "v":
+                flip_v = not flip_v
+                valign = self._align_vertical[valign]
+
+        if not (transpose or flip_v or flip_h):
+            return self
+        rows = slice(None, None, -1 if flip_v else 1)
+        cols = slice(None, None, -1 if flip_h else 1)
+        char = self._char.T if transpose else self._char
+        alpha = self._alpha.T if transpose else self._alpha
+        return Str2D._from_planes(
+            char[rows, cols], alpha[rows, cols], halign, valign, self.fill
+        )
+
     def __getattr__(self, name: str) -> Any:
         """Enables convenient access to the transpose, horizontal flip, vertical flip,
         and rotation methods in a concatenated manner.
         """
         if (p := name[0].lower()) in ["h", "v", "t", "r", "i"]:
-            this = getattr(self, p)
-            if len(name) == 1:
-                return this
-            return getattr(getattr(self, p), name[1:])
+            # memoize the end of the chain per name, every step is a cached_property
+            # so the result is the same object as walking the chain again
+            cache = self.__dict__.setdefault("_chain_cache", {})
+            if name in cache:
+                return cache[name]
+            chain = name.lower()
+            if type(self) is Str2D and len(chain) > 1 and set(chain) <= set("hvtri"):
+                this = self._orient(chain)
+            else:
+                this = getattr(self, p)
+                if len(name) > 1:
+                    this = getattr(this, name[1:])
+            cache[name] = this
+            return this
         raise AttributeError(f"'{Str2D.__name__}' object has no attribute '{name}'")
 
     __getattr__.__doc__ += TRANSFORMATIONS_DOCSTRING
@@ -1801,7 +2224,9 @@ class Str2D:
             a b c de f g  h i    j
 
         """
-        return Str2D(data=self.data.reshape(shape), **self.kwargs)
+        return Str2D._from_planes(
+            self._char.reshape(shape), self._alpha.reshape(shape), **self.kwargs
+        )
 
     def show_with_alignment(self, expand=2, box=True) -> "Str2D":
         """Show the alignment parameters with object.
@@ -1859,10 +2284,12 @@ class Str2D:
         if box:
             body = body.box().view
 
-        body = Str2D(body, valign="middle", halign="center")
+        body = Str2D._from_planes(
+            body._char, body._alpha, "center", "middle", self.validate_fill()
+        )
 
         sep = Str2D("-" * max(body.width, footer.width))
-        return body / sep / footer
+        return self.join_v(body, sep, footer)
 
     def transormation_palette(self, sep=" | ", expand=2, box=True) -> "Str2D":
         """Show the transformation palette.  This is a visual representation of the
@@ -2017,15 +2444,22 @@ class Str2D:
             h i
 
         """
-
-        return Str2D(
-            data=np.roll(self.data, x, axis=axis),
-            halign=self.halign,
-            valign=self.valign,
-            fill=self.fill,
+        n = self.shape[axis]
+        k = x % n if n else 0
+        if not k:
+            return self
+
+        # same as np.roll, concatenate the last k and the first n - k positions
+        tail = [slice(None)] * 2
+        head = [slice(None)] * 2
+        tail[axis] = slice(n - k, None)
+        head[axis] = slice(None, n - k)
+        char = np.concatenate((self._char[tuple(tail)], self._char[tuple(head)]), axis)
+        alpha = np.concatenate(
+            (self._alpha[tuple(tail)], self._alpha[tuple(head)]), axis
         )
+        return Str2D._from_planes(char, alpha, **self.kwargs)
 
-    @lru_cache
     def roll_h(self, x: int) -> "Str2D":
         """Roll the data horizontally.
 
@@ -2065,7 +2499,6 @@ class Str2D:
         """
         return self.roll(x, axis=1)
 
-    @lru_cache
     def roll_v(self, x: int) -> "Str2D":
         """Roll the data vertically.
 
@@ -2227,9 +2660,9 @@ class Str2D:
 
         """
         kwargs.setdefault("fill", self.fill)
-        padded_data = self.struct_pad(self.data, *args, **kwargs)
+        char, alpha = self._pad_planes(self._char, self._alpha, *args, **kwargs)
 
-        return Str2D(data=padded_data, **self.kwargs)
+        return Str2D._from_planes(char, alpha, **self.kwargs)
 
     def expand(self, x: int = 0, y: int = 0, **kwargs) -> "Str2D":
         """The `expand` method expands the data by adding padding to the top, bottom,
@@ -2302,20 +2735,33 @@ class Str2D:
 
         """
         kwargs["fill"] = self.validate_fill(kwargs.get("fill", self.fill))
-        top = 0
-        left = 0
-        if self.halign == "center":
-            left = x // 2
-        elif self.halign == "right":
-            left = x
-        if self.valign == "middle":
-            top = y // 2
-        elif self.valign == "bottom":
-            top = y
-        right = x - left
-        bottom = y - top
+        if x == 0 and y == 0:
+            return self
+
+        left, right = self._split_extra(x, self.halign)
+        top, bottom = self._split_extra(y, self.valign)
+        constant = kwargs.keys() <= {"fill", "mode"} and kwargs.get("mode") in (
+            None,
+            "constant",
+        )
+        if constant and x >= 0 and y >= 0:
+            return self._pad_constant(top, bottom, left, right, kwargs["fill"])
         return self.pad(((top, bottom), (left, right)), **kwargs)
 
+    def _pad_constant(
+        self, top: int, bottom: int, left: int, right: int, fill: Tuple[str, int]
+    ) -> "Str2D":
+        """Same as `pad` with the `'constant'` mode, but the planes are allocated
+        filled and the data is copied into the middle rather than going through
+        `np.pad`.  This is the padding every join does to equalize its parts."""
+        height, width = self.shape
+        shape = (top + height + bottom, left + width + right)
+        char = np.full(shape, fill[0], dtype=self._char.dtype)
+        alpha = np.full(shape, fill[1], dtype=self._alpha.dtype)
+        char[top : top + height, left : left + width] = self._char
+        alpha[top : top + height, left : left + width] = self._alpha
+        return Str2D._from_planes(char, alpha, **self.kwargs)
+
     def split(self, indices_or_sections, axis=0) -> List["Str2D"]:
         """`split` is analogous to np.split and splits the data along an axis.  It'll
         return a list of Str2D objects split along the specified axis at the specified
@@ -2438,9 +2884,11 @@ class Str2D:
             s tuvw x
 
         """
+        chars = np.split(self._char, indices_or_sections, axis)
+        alphas = np.split(self._alpha, indices_or_sections, axis)
         return [
-            Str2D(data=divided, **self.kwargs)
-            for divided in np.split(self.data, indices_or_sections, axis)
+            Str2D._from_planes(char, alpha, **self.kwargs)
+            for char, alpha in zip(chars, alphas)
         ]
 
     def insert(self, indices_or_sections, axis=0, sep=" "):
@@ -2586,14 +3034,55 @@ class Str2D:
             23450
         
         """
+        # integers become length 1 slices so that the result stays 2D and is a view
+        # rather than an advanced indexing copy
         if isinstance(key, tuple):
-            new_key = tuple(([k] if np.isscalar(k) else k) for k in key)
-        elif np.isscalar(key):
-            new_key = [key]
+            new_key = (
+                tuple(
+                    self._int_to_slice(k, n) if isinstance(k, (int, np.integer)) else k
+                    for k, n in zip(key[:2], self.shape)
+                )
+                + key[2:]
+            )
+        elif isinstance(key, (int, np.integer)):
+            new_key = self._int_to_slice(key, self.height)
         else:
             new_key = key
 
-        return Str2D(data=self.data[new_key], **self.kwargs)
+        return Str2D._from_planes(
+            self._char[new_key], self._alpha[new_key], **self.kwargs
+        )
+
+    def __iter__(self) -> Iterator["Str2D"]:
+        """Iterate over the rows of the data.  Each row is a Str2D object with a height
+        of 1, the same as `self[i]`, and a view of this object's data.
+
+        Examples
+        --------
+        .. testcode::
+
+            from str2d import Str2D
+
+            a = Str2D('ab\\ncd')
+            [str(row) for row in a]
+
+        .. testoutput::
+
+            ['ab', 'cd']
+
+        """
+        kwargs = self.kwargs
+        for char, alpha in zip(self._char, self._alpha):
+            yield Str2D._from_planes(char[None], alpha[None], **kwargs)
+
+    @staticmethod
+    def _int_to_slice(k: int, n: int) -> slice:
+        """Convert the integer index `k` along an axis of length `n` into the slice
+        that selects the same single position."""
+        if not -n <= k < n:
+            raise IndexError(f"index {k} is out of bounds for axis with size {n}")
+        k %= n
+        return slice(k, k + 1)
 
     def circle(self, radius: float, char: str = "*") -> "Str3D":
         """Create a circle over object. This is a wrapper around the `circle` function
@@ -2744,6 +3233,31 @@ class Str2D:
         c = hole(radius, self.height, self.width, char)
         return Str3D([c, self])
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _frame_prototype(height: int, width: int, style: Union[BoxStyle, str]) -> "Box":
+        """Return a single cell Box with the given inner size.  Boxes only depend on
+        their size and style, so one is drawn per size and style and kept with
+        read-only planes.  It is never handed out, see `_frame`."""
+        box = Box([height], [width], style)
+        box._char.flags.writeable = False
+        box._alpha.flags.writeable = False
+        return box
+
+    @classmethod
+    def _frame(cls, height: int, width: int, style: Union[BoxStyle, str]) -> "Box":
+        """Return a new single cell Box with the given inner size.  Its planes are
+        copied from the cached `_frame_prototype` instead of being drawn again, so the
+        caller owns the result and may change it."""
+        prototype = cls._frame_prototype(height, width, style)
+        frame = object.__new__(Box)
+        frame.__dict__.update(prototype.__dict__)
+        frame._char = prototype._char.copy()
+        frame._alpha = prototype._alpha.copy()
+        frame.spec_v = list(prototype.spec_v)
+        frame.spec_h = list(prototype.spec_h)
+        return frame
+
     def box_over(self, style: Union[BoxStyle, str] = BoxStyle.SINGLE_ROUND) -> "Str3D":
         """Create a box over the data.  The difference between this and `box_around` is
         that this method creates a box over the data and the other method creates a box
@@ -2796,7 +3310,7 @@ class Str2D:
             ╰────╯
 
         """
-        box = Box([self.height - 2], [self.width - 2], style)
+        box = self._frame(self.height - 2, self.width - 2, style)
         return Str3D([box, self])
 
     def box_around(
@@ -2856,7 +3370,7 @@ class Str2D:
 
         """
         s = self.pad(((1, 1), (1, 1)))
-        box = Box([self.height], [self.width], style)
+        box = self._frame(self.height, self.width, style)
         return Str3D([box, s])
 
     def box(
@@ -2933,6 +3447,28 @@ class Str2D:
             return self.box_around(style)
         return self.box_over(style)
 
+    @classmethod
+    def _constant_digits(cls, name: str, n: int) -> str:
+        """Return the first `n` characters of the decimal representation of the
+        mpmath constant `name`, including the decimal point.  The representation is
+        computed once with a few guard digits and cached on the class, it is only
+        recomputed when more characters are requested."""
+        digits = cls._digits_cache.get(name, "")
+        if len(digits) < n:
+            with mp.workdps(max(n, 2 * len(digits)) + 10):
+                digits = str(getattr(mp, name))
+            cls._digits_cache[name] = digits
+        return digits[:n]
+
+    def _fill_digits(self, name: str) -> "Str2D":
+        """Replace the visible characters with the digits of the mpmath constant
+        `name`, in row major order."""
+        char = self._char.copy()
+        mask = self._alpha != 0
+        digits = self._constant_digits(name, np.count_nonzero(mask))
+        char[mask] = np.frombuffer(digits.encode("utf-32-le"), dtype="<U1")
+        return Str2D._from_planes(char, self._alpha.copy(), **self.kwargs)
+
     def pi(self):
         """Replace the data with digits of pi.  This is a wrapper around the `pi`
         function and returns a new Str2D object with the data replaced with the digits
@@ -2972,14 +3508,7 @@ class Str2D:
             384626
 
         """
-        data = self.data.copy()
-        i, j = data["alpha"].nonzero()
-        old_dps = mp.mp.dps
-        n = len(i)
-        mp.mp.dps = n
-        data["char"][i, j] = [*str(mp.pi)][:n]
-        mp.mp.dps = old_dps
-        return Str2D(data=data, **self.kwargs)
+        return self._fill_digits("pi")
 
     def e(self):
         """Replace the data with digits of e.  This is a wrapper around the `e`
@@ -3020,14 +3549,7 @@ class Str2D:
             353602
 
         """
-        data = self.data.copy()
-        i, j = data["alpha"].nonzero()
-        old_dps = mp.mp.dps
-        n = len(i)
-        mp.mp.dps = n
-        data["char"][i, j] = [*str(mp.e)][:n]
-        mp.mp.dps = old_dps
-        return Str2D(data=data, **self.kwargs)
+        return self._fill_digits("e")
 
     def phi(self):
         """Replace the data with digits of phi.  This is a wrapper around the `phi`
@@ -3068,14 +3590,7 @@ class Str2D:
             482045
 
         """
-        data = self.data.copy()
-        i, j = data["alpha"].nonzero()
-        old_dps = mp.mp.dps
-        n = len(i)
-        mp.mp.dps = n
-        data["char"][i, j] = [*str(mp.phi)][:n]
-        mp.mp.dps = old_dps
-        return Str2D(data=data, **self.kwargs)
+        return self._fill_digits("phi")
 
     def hide(self, char=" "):
         """Hide where character array is char.  This sets the alpha array to 0 where the
@@ -3128,10 +3643,11 @@ class Str2D:
             stuvwx
 
         """
-        data = self.data.copy()
-        i, j = (data["char"] == char).nonzero()
-        data["alpha"][i, j] = 0
-        return Str2D(data=data, **self.kwargs)
+        alpha = self._alpha.copy()
+        alpha[self._char == char] = 0
+        return Str2D._from_planes(
+            self._char.copy(), alpha, self.halign, self.valign, self.fill
+        )
 
     def fill_with(self, char=" ") -> "Str2D":
         """Fill the data with the character.  This is a wrapper around the `fill` method
@@ -3187,33 +3703,69 @@ class Str2D:
             z......
 
         """
-        kwargs = self.kwargs
-        kwargs["fill"] = (char, 0)
-        data = np.where(self.data["alpha"], self.data["char"], char)
-        return Str2D(data=data, **kwargs)
+        fill = self.validate_fill(char)
+        chars = self._char.copy()
+        chars[self._mask_alpha0] = char
+        alpha = np.ones(self.shape, dtype=self._alpha.dtype)
+        return Str2D._from_planes(chars, alpha, self.halign, self.valign, fill)
 
     def __str__(self) -> str:
         """Return the string representation of the data."""
-        return "\n".join(["".join(row["char"]) for row in self.data])
+        return "\n".join(self._row_strings().tolist())
 
     def __repr__(self) -> str:
         """Return the string representation of the data."""
         return str(self)
 
+    def _with_field(self, field: str, values: np.ndarray) -> "Str2D":
+        """Return a new Str2D object where `field` is set to `values` and the other
+        field is copied from this object.  Only the untouched plane is copied."""
+        char = self._char.copy() if field == "alpha" else values.astype("<U1")
+        alpha = self._alpha.copy() if field == "char" else values.astype("int8")
+        return Str2D._from_planes(char, alpha, **self.kwargs)
+
+    def _map_chars(
+        self,
+        func: Callable[[str], str],
+        cell_func: Callable[[np.ndarray], np.ndarray],
+        rows: bool = False,
+    ) -> "Str2D":
+        """Return a new Str2D object with `func` applied to the characters.
+
+        All characters are viewed as one flat string so that `func` runs once over the
+        whole data instead of once per cell.  With `rows=True` the rows are separated by
+        newlines in that string, for functions like `str.title` that depend on where a
+        row starts.  When that doesn't give back exactly one character per cell, e.g.
+        `'ß'.upper()` is `'SS'`, `cell_func` is applied to the character array instead.
+        """
+        if not self._char.size:
+            return self._with_field("char", self._char)
+        height, width = self.shape
+        char = self._char
+        if rows:
+            newlines = np.full((height, 1), "\n", dtype=char.dtype)
+            char = np.hstack([char, newlines])
+        size = char.size
+        flat = np.ascontiguousarray(char).reshape(-1).view(f"<U{size}")
+        mapped = func(str(flat[0]))
+        if len(mapped) == size:
+            char = np.array(mapped).reshape(1).view("<U1").reshape(char.shape)
+            return self._with_field("char", char[:, :width])
+        return self._with_field("char", cell_func(self._char))
+
     ####################################################################
     # String operations whose result is a new Str2D ####################
     ####################################################################
     def lower(self) -> "Str2D":
         """Return the lowercase version of the data."""
-        data = self.data.copy()
-        data["char"] = np.char.lower(data["char"])
-        return Str2D(data=data, **self.kwargs)
+        # str.lower maps a final capital sigma differently depending on its neighbors
+        if (self._char == "Σ").any():
+            return self._with_field("char", np.char.lower(self._char))
+        return self._map_chars(str.lower, np.char.lower)
 
     def upper(self) -> "Str2D":
         """Return the uppercase version of the data."""
-        data = self.data.copy()
-        data["char"] = np.char.upper(data["char"])
-        return Str2D(data=data, **self.kwargs)
+        return self._map_chars(str.upper, np.char.upper)
 
     def replace(self, old: str, new: str) -> "Str2D":
         """Replace the data.
@@ -3238,55 +3790,69 @@ class Str2D:
         """
         if len(old) != len(new):
             raise ValueError("old and new must have the same length.")
-        data = self.data.copy()
-        data["char"] = np.char.replace(data["char"], old, new)
-        return Str2D(data=data, **self.kwargs)
+        if len(old) != 1:
+            # on the flat data a longer `old` could match across neighboring cells
+            return self._with_field("char", np.char.replace(self._char, old, new))
+        return self._map_chars(
+            lambda flat: flat.replace(old, new),
+            lambda char: np.char.replace(char, old, new),
+        )
 
     def title(self) -> "Str2D":
-        """Return the title version of the data."""
-        data = self.data.copy()
-        char = "".join(data["char"].ravel()).title()
-        data["char"] = np.array(list(char)).reshape(data["char"].shape)
-        return Str2D(data=data, **self.kwargs)
+        """Return the title version of the data.  Each row is title cased on its own."""
+        return self._map_chars(str.title, self._title_rows, rows=True)
+
+    def _title_rows(self, char: np.ndarray) -> np.ndarray:
+        """Title case each row of the character array on its own with `np.char.title`,
+        keeping one character per cell."""
+        height, width = char.shape
+        rows = np.ascontiguousarray(char).view(f"<U{max(width, 1)}").ravel()
+        rows = np.char.title(rows).astype(f"<U{max(width, 1)}")
+        return rows.view("<U1").reshape(height, max(width, 1))[:, :width]
 
     def strip(self, *args, **kwargs) -> "Str2D":
         """Strip line by line.  Return the stripped version of the data.  This is a
         wrapper around the `strip` method from the str class."""
-        data = self.data.copy()
-        char = ["".join(row).strip(*args, **kwargs) for row in data["char"]]
-        return Str2D(data=char, **self.kwargs)
+        rows = np.char.strip(self._row_strings(), *args, **kwargs)
+        data = self.struct_array_from_rows(rows, **self.kwargs)
+        return Str2D._from_validated(data, **self.kwargs)
 
     def lstrip(self, *args, **kwargs) -> "Str2D":
         """Left strip line by line.  Return the left stripped version of the data.  This
         is a wrapper around the `lstrip` method from the str class."""
-        data = self.data.copy()
-        char = ["".join(row).lstrip(*args, **kwargs) for row in data["char"]]
-        return Str2D(data=char, **self.kwargs)
+        rows = np.char.lstrip(self._row_strings(), *args, **kwargs)
+        data = self.struct_array_from_rows(rows, **self.kwargs)
+        return Str2D._from_validated(data, **self.kwargs)
 
     def rstrip(self, *args, **kwargs) -> "Str2D":
         """Right strip line by line.  Return the right stripped version of the data.
         This is a wrapper around the `rstrip` method from the str class."""
-        data = self.data.copy()
-        char = ["".join(row).rstrip(*args, **kwargs) for row in data["char"]]
-        return Str2D(data=char, **self.kwargs)
+        rows = np.char.rstrip(self._row_strings(), *args, **kwargs)
+        data = self.struct_array_from_rows(rows, **self.kwargs)
+        return Str2D._from_validated(data, **self.kwargs)
 
     ####################################################################
     # String operations whose result is a new boolean array ############
     ####################################################################
     def isdigit(self) -> "Str2D":
         """Return whether the data is a digit."""
-        data = self.data.copy()
-        data["alpha"] = np.char.isdigit(data["char"]).astype("int8")
-        return Str2D(data=data, **self.kwargs)
+        return self._with_field("alpha", np.char.isdigit(self._char))
 
     def __eq__(self, other: Any) -> "Str2D":
         """Return whether the data is equal to the other data."""
         if isinstance(other, str):
             if len(other) == 1:
-                return self.data["char"] == other
+                return self._char == other
+            # every row is `width` characters long and rows are separated by newlines,
+            # so a string of any other length can't match
+            height, width = self.shape
+            if len(other) != max(height * (width + 1) - 1, 0):
+                return False
             return str(self) == other
         if isinstance(other, Str2D):
-            return self.data["char"] == other.data["char"]
+            if self.shape != other.shape:
+                return False
+            return self._char == other._char
         raise ValueError("other must be a Str2D object or a scalar.")
 
     def __ne__(self, other: Any) -> "Str2D":
@@ -3344,9 +3910,14 @@ class Str2D:
             xxxxxxx
 
         """
-        mask = self != char
-        x0, x1 = np.flatnonzero(mask.any(axis=1))[[0, -1]]
-        y0, y1 = np.flatnonzero(mask.any(axis=0))[[0, -1]]
+        # find the rows by comparing whole row strings, then only look at the columns
+        # of the rows that are kept
+        rows = np.flatnonzero(self._row_strings() != char * self.width)
+        if not rows.size:
+            return self[0:0, 0:0]
+        x0, x1 = rows[[0, -1]]
+        cols = (self._char[x0 : x1 + 1] != char).any(axis=0)
+        y0, y1 = np.flatnonzero(cols)[[0, -1]]
         return self[x0 : x1 + 1, y0 : y1 + 1]
 
 
@@ -3435,36 +4006,47 @@ class Box(Str2D):
         self.pos_h = pos_h
         self.chars = chars
 
-        data = np.empty((height, width), dtype=Str2D._dtype)
-        data.fill((" ", 0))
-
-        super().__init__(data)
+        # assign_box_char fills every cell, no need to parse and pad an empty array
+        self._char = np.empty((height, width), dtype="<U1")
+        self._alpha = np.empty((height, width), dtype=np.int8)
+        self.halign = "left"
+        self.valign = "top"
+        self.fill = self.validate_fill()
 
         self.assign_box_char()
 
     def assign_box_char(self):
         """Assign the box characters."""
 
-        data = self.data
+        char = self._char
+        alpha = self._alpha
         pos_v = self.pos_v
         pos_h = self.pos_h
         chars = self.chars
 
-        data[:, pos_h] = (chars.v, 1)
-        data[pos_v, :] = (chars.h, 1)
+        char.fill(" ")
+        alpha.fill(0)
+
+        char[:, pos_h] = chars.v
+        alpha[:, pos_h] = 1
+        char[pos_v, :] = chars.h
+        alpha[pos_v, :] = 1
 
-        data[0, pos_h] = (chars.t, 1)
-        data[-1, pos_h] = (chars.b, 1)
+        char[0, pos_h] = chars.t
+        char[-1, pos_h] = chars.b
 
-        data[pos_v, 0] = (chars.l, 1)
-        data[pos_v, -1] = (chars.r, 1)
+        char[pos_v, 0] = chars.l
+        char[pos_v, -1] = chars.r
 
-        data[np.ix_(pos_v[1:-1], pos_h[1:-1])] = (chars.c, 1)
+        char[np.ix_(pos_v[1:-1], pos_h[1:-1])] = chars.c
 
-        pos_v_corners = [[0, 0], [-1, -1]]
-        pos_h_corners = [[0, -1], [0, -1]]
-        corners = [[(chars.ul, 1), (chars.ur, 1)], [(chars.ll, 1), (chars.lr, 1)]]
-        data[pos_v_corners, pos_h_corners] = corners
+        for i, j, corner in [
+            (0, 0, chars.ul),
+            (0, -1, chars.ur),
+            (-1, 0, chars.ll),
+            (-1, -1, chars.lr),
+        ]:
+            char[i, j] = corner
 
         return self
 
@@ -3495,11 +4077,31 @@ class Str3D:
     def __init__(self, data):
         """Create a Str3D object."""
         self.source = data
-        self.data = np.stack([datum.data for datum in data])
+        self.update()
 
-    def update(self):
-        """Update the data."""
-        self.data = np.stack([datum.data for datum in self.source])
+    def update(self, layer=None):
+        """Update the data from the source Str2D objects.  If `layer` is given, as an
+        index or a list of indices, only those layers are copied into the existing
+        arrays.  Otherwise all layers are stacked again."""
+        if layer is None:
+            self._char = np.stack([datum.char for datum in self.source])
+            self._alpha = np.stack([datum.alpha for datum in self.source])
+            return
+
+        if np.isscalar(layer):
+            layer = [layer]
+
+        for i in layer:
+            self._char[i] = self.source[i].char
+            self._alpha[i] = self.source[i].alpha
+
+    @property
+    def data(self):
+        """Return the layers as a 3D structured array with fields 'char' and 'alpha'."""
+        data = np.empty(self._char.shape, dtype=Str2D._dtype)
+        data["char"] = self._char
+        data["alpha"] = self._alpha
+        return data
 
     def __str__(self):
         """Return the string representation of the data."""
@@ -3529,7 +4131,6 @@ class Str3D:
         """Return the 90 degree rotation of the data."""
         return self.t.h
 
-    @lru_cache
     def roll(self, *args, **kwargs) -> "Str3D":
         """Roll the data along an axis."""
 
@@ -3550,12 +4151,19 @@ class Str3D:
 
     @property
     def view(self):
-        """Return the view of the data."""
-        argmax = self.data["alpha"].argmax(axis=0)
-        _, height, width = self.data.shape
-        y_indices, x_indices = np.ogrid[:height, :width]
-        result = self.data[argmax, y_indices, x_indices]
-        return Str2D(result)
+        """Return the view of the data.  Each position shows the first layer with the
+        highest alpha value."""
+        # composite layer by layer, only a later layer with a strictly greater alpha
+        # replaces the current one, which keeps the first maximum like argmax would
+        char = self._char[0].copy()
+        alpha = self._alpha[0].copy()
+        for layer_char, layer_alpha in zip(self._char[1:], self._alpha[1:]):
+            above = layer_alpha > alpha
+            char[above] = layer_char[above]
+            alpha[above] = layer_alpha[above]
+        return Str2D._from_planes(
+            char, alpha, halign="left", valign="top", fill=Str2D.validate_fill()
+        )
 
     def __getattr__(self, name: str) -> Any:
         """Enables convenient access to the transpose, horizontal flip, vertical flip,
@@ -3566,6 +4174,14 @@ class Str3D:
         raise AttributeError(f"'{Str3D.__name__}' object has no attribute '{name}'")
 
 
+def _check_cell_counts(**counts: int) -> None:
+    """Raise a ValueError naming the first of `counts` that is less than 1.  Shared
+    by `space` and `boundary`, which both divide a range into cells."""
+    for name, count in counts.items():
+        if count < 1:
+            raise ValueError(f"{name}={count!r} must be >= 1")
+
+
 def space(mn: float, mx: float, w: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Return left, center, and right points of a space.
     Imagine an integer number of cells.  I want to assign the left side of the left most
@@ -3614,8 +4230,7 @@ def space(mn: float, mx: float, w: int) -> Tuple[np.ndarray, np.ndarray, np.ndar
     ValueError
         If `w` is less than 1.
     """
-    if w < 1:
-        raise ValueError(f"{w=} must be >= 1")
+    _check_cell_counts(w=w)
 
     a = np.linspace(mn, mx, w + 1)
     return a[:-1], (a[:-1] + a[1:]) / 2, a[1:]
@@ -3767,17 +4382,37 @@ def boundary(func, height, width, x_range, y_range):
                           **
 
     """
-    left, _, right = space(*x_range, width)
-    bottom, _, top = space(*y_range[::-1], height)
-    mask = np.stack(
-        [
-            func(left[None, :], top[:, None]),
-            func(right[None, :], top[:, None]),
-            func(right[None, :], bottom[:, None]),
-            func(left[None, :], bottom[:, None]),
-        ]
-    )
-    return mask.any(axis=0) & ~mask.all(axis=0)
+    # neighboring cells share corners, so evaluate `func` once on the lattice of all
+    # (height + 1) x (width + 1) corners and look at it through 4 shifted views
+    _check_cell_counts(width=width, height=height)
+    xs = np.linspace(*x_range, width + 1)
+    ys = np.linspace(*y_range[::-1], height + 1)
+    corners = np.asarray(func(xs[None, :], ys[:, None]), dtype=bool)
+    upper_left = corners[:-1, :-1]
+    upper_right = corners[:-1, 1:]
+    lower_left = corners[1:, :-1]
+    lower_right = corners[1:, 1:]
+    any_true = upper_left | upper_right | lower_left | lower_right
+    all_true = upper_left & upper_right & lower_left & lower_right
+    return any_true & ~all_true
+
+
+def _disk_ranges(height, width):
+    """Return the x and y ranges that make a unit disk look round on a grid of
+    `height` rows and `width` columns, where a character is about twice as tall as it
+    is wide.  Shared by `circle` and `hole`."""
+    height_limited = True
+    if width < height * 2:
+        height_limited = False
+
+    if height_limited:
+        y_range = np.array([-1, 1])
+        x_range = width / height / 2 * y_range
+    else:
+        x_range = np.array([-1, 1])
+        y_range = height * 2 / width * x_range
+
+    return x_range, y_range
 
 
 def circle(radius, height, width, char="*"):
@@ -3810,16 +4445,7 @@ def circle(radius, height, width, char="*"):
     Str2D.circle : Create a circle.
 
     """
-    height_limited = True
-    if width < height * 2:
-        height_limited = False
-
-    if height_limited:
-        y_range = np.array([-1, 1])
-        x_range = width / height / 2 * y_range
-    else:
-        x_range = np.array([-1, 1])
-        y_range = height * 2 / width * x_range
+    x_range, y_range = _disk_ranges(height, width)
 
     mask = boundary(
         lambda x, y: x**2 + y**2 < radius**2, height, width, x_range, y_range
@@ -3858,16 +4484,7 @@ def hole(radius, height, width, char="*"):
     Str2D.hole : Create a hole.
 
     """
-    height_limited = True
-    if width < height * 2:
-        height_limited = False
-
-    if height_limited:
-        y_range = np.array([-1, 1])
-        x_range = width / height / 2 * y_range
-    else:
-        x_range = np.array([-1, 1])
-        y_range = height * 2 / width * x_range
+    x_range, y_range = _disk_ranges(height, width)
 
     mask = region(
         lambda x, y: x**2 + y**2 <= radius**2, height, width, x_range, y_range
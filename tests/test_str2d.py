@@ -1,6 +1,8 @@
 """Tests for str2d.py."""
 
-from str2d import Str2D
+import pytest
+
+from str2d import Str2D, Str3D, boundary, space
 
 
 def test_str_in():
@@ -185,3 +187,162 @@ def test_t_00():
     a = Str2D("a").box().view
     s = a.tt
     assert s == str(a)
+
+
+def test_t_01():
+    a = Str2D("ab\nc", halign="right", valign="bottom", fill=".")
+    s = a.t
+    assert s == "a.\nbc"
+    assert s.kwargs == {"halign": "right", "valign": "bottom", "fill": (".", 0)}
+
+
+def test_join_h_00():
+    a = Str2D("a")
+    b = Str2D("b\nb\nb")
+    s = Str2D.join_h(a, b, a, sep="|")
+    assert s == "a|b|a\n |b| \n |b| "
+
+
+def test_strip_00():
+    a = Str2D("  ab \n c\n    ", halign="right")
+    s = a.strip()
+    assert s == "ab\n c\n  "
+    assert s.shape == (3, 2)
+
+
+def test_strip2d_00():
+    a = Str2D("....\n.xy.\n..z.\n....")
+    assert a.strip2d(char=".") == "xy\n.z"
+    assert a.fill_with(".").strip2d(char=".").shape == (2, 2)
+    assert Str2D("...\n...").strip2d(char=".").shape == (0, 0)
+
+
+def test_roll_00():
+    a = Str2D("abc\ndef")
+    assert a.roll_h(1) == "cab\nfde"
+    assert a.roll_v(-1) == "def\nabc"
+    assert a.roll(3, axis=1) is a
+
+
+def test_getitem_00():
+    a = Str2D("abc\ndef")
+    assert a[1, 2] == "f"
+    assert a[-1, -1] == "f"
+    assert a[:, -1] == "c\nf"
+    with pytest.raises(IndexError):
+        a[2]
+
+
+def test_title_00():
+    a = Str2D("hello world\nfoo bar")
+    assert a.title() == "Hello World\nFoo Bar    "
+
+
+def test_str3d_update_00():
+    a = Str2D("ab\ncd")
+    b = Str2D("xy\nzw").hide("y")
+    s = Str3D([b, a])
+    assert s.view == "xb\nzw"
+    b.alpha[:] = 0
+    s.update(layer=0)
+    assert s.view == "ab\ncd"
+
+
+def test_mul_00():
+    a = Str2D("ab\nc")
+    assert a * 2 == "abab\nc c "
+    assert 2 * a == "ab\nc \nab\nc "
+    assert (a * 0).shape == (0, 0)
+    assert (-1 * a).shape == (0, 0)
+
+
+def test_involution_00():
+    a = Str2D("ab\nc", halign="right")
+    assert a.tt is a
+    assert a.hh is a
+    assert a.vv is a
+    assert a.rrrr == str(a)
+
+
+def test_add_char_00():
+    a = Str2D("ab\nc", halign="right")
+    assert str(a + "|") == "ab|\n c|"
+    assert str("|" + a) == "|ab\n| c"
+    assert str(a / "-") == "ab\n c\n--"
+    assert (a + "|").kwargs == a.kwargs
+
+
+def test_case_00():
+    a = Str2D("straße\nab")
+    assert str(a.upper()) == "STRASE\nAB    "
+    assert str(a.upper().lower()) == "strase\nab    "
+    assert str(a.replace("a", "Z")) == "strZße\nZb    "
+    assert Str2D().upper().shape == (0, 0)
+
+
+def test_chain_00():
+    a = Str2D("abc\nde", halign="right", valign="bottom")
+    for name in ["tv", "hvt", "rrr", "thirvt"]:
+        b = a
+        for step in name:
+            b = getattr(b, step)
+        assert str(getattr(a, name)) == str(b)
+        assert getattr(a, name).kwargs == b.kwargs
+    assert a.hh is a
+
+
+def test_eq_00():
+    a = Str2D("ab\ncd")
+    assert (a == Str2D("ab\ncd")).all()
+    assert (a == Str2D("ab")) is False
+    assert (a != Str2D("abc")) is True
+
+
+def test_iter_00():
+    a = Str2D("ab\ncd", halign="right")
+    rows = list(a)
+    assert [str(row) for row in rows] == ["ab", "cd"]
+    assert all(row.kwargs == a.kwargs for row in rows)
+    assert list(Str2D()) == []
+
+
+def test_empty_min_width_00():
+    assert Str2D(min_width=3).shape == (0, 3)
+    assert Str2D("", min_width=3).shape == (0, 3)
+    assert Str2D([], min_width=2).shape == (0, 2)
+    assert Str2D("", min_width=3, min_height=2).shape == (2, 3)
+
+
+def test_box_over_fresh_frame_00():
+    b = Str2D("ab\ncd").box_over()
+    b.source[0].char[0, 0] = "X"
+    assert str(Str2D("xy\nzw").box_over()).startswith("╭")
+    assert str(Str2D("xy\nzw").box_around()).startswith("╭")
+
+
+def test_equal_writable_00():
+    for equal in (Str2D.equal_height, Str2D.equal_width):
+        first = equal("ab", Str2D("x"))[0]
+        second = equal("ab", Str2D("x"))[0]
+        assert first is not second
+        first.char[0, 0] = "Z"
+        first.alpha[0, 0] = 0
+        assert str(second).startswith("a")
+
+
+def test_hide_writable_00():
+    a = Str2D("xb")
+    b = a.hide("x")
+    assert b.char.flags.writeable
+    b.char[0, 1] = "Z"
+    assert str(a) == "xb"
+    assert b.alpha[0, 0] == 0
+
+
+def test_cell_counts_00():
+    with pytest.raises(ValueError, match="w=0"):
+        space(0, 1, 0)
+    with pytest.raises(ValueError, match="width=0"):
+        boundary(lambda x, y: x < y, 2, 0, [0, 1], [0, 1])
+    with pytest.raises(ValueError, match="height=0"):
+        boundary(lambda x, y: x < y, 0, 2, [0, 1], [0, 1])